@@ -4,7 +4,6 @@ from functools import wraps
 import l18n
 from django.contrib.auth import get_user_model
 from django.core.exceptions import PermissionDenied
-from django.db.models import Q
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.utils.timezone import activate as activate_tz
@@ -20,18 +19,33 @@ def users_with_page_permission(page, permission_type, include_superusers=True):
     # Get user model
     User = get_user_model()
 
-    # Find GroupPagePermission records of the given type that apply to this page or an ancestor
-    ancestors_and_self = list(page.get_ancestors()) + [page]
+    # Find GroupPagePermission records of the given type that apply to this page or an
+    # ancestor. Passing the ancestor queryset through as a subquery avoids fetching and
+    # hydrating the ancestor Page rows just to extract their ids
     perm = GroupPagePermission.objects.filter(
-        permission_type=permission_type, page__in=ancestors_and_self
+        permission_type=permission_type,
+        page__in=page.get_ancestors(inclusive=True),
+    )
+    # Query the permission-derived users and superusers separately and combine the pk
+    # sets with UNION; this avoids a DISTINCT over the wide join through
+    # user -> group -> page permission that the OR-ed filter used to require.
+    # The subqueries are explicitly unordered, as compound subqueries cannot
+    # carry an ORDER BY (and custom user models may define a default ordering)
+    user_pks = (
+        User.objects.filter(is_active=True, groups__page_permissions__in=perm)
+        .order_by()
+        .values_list("pk", flat=True)
     )
-    q = Q(groups__page_permissions__in=perm)
 
     # Include superusers
     if include_superusers:
-        q |= Q(is_superuser=True)
+        user_pks = user_pks.union(
+            User.objects.filter(is_active=True, is_superuser=True)
+            .order_by()
+            .values_list("pk", flat=True)
+        )
 
-    return User.objects.filter(is_active=True).filter(q).distinct()
+    return User.objects.filter(pk__in=user_pks)
 
 
 def permission_denied(request):
@@ -90,11 +104,7 @@ def any_permission_required(*perms):
     """
 
     def test(user):
-        for perm in perms:
-            if user.has_perm(perm):
-                return True
-
-        return False
+        return any(user.has_perm(perm) for perm in perms)
 
     return user_passes_test(test)
 
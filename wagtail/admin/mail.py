@@ -4,7 +4,7 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.mail import get_connection
 from django.core.mail.message import EmailMultiAlternatives
-from django.template.loader import render_to_string
+from django.template.loader import get_template, render_to_string
 from django.utils.translation import override
 
 from wagtail.admin.auth import users_with_page_permission
@@ -91,31 +91,51 @@ def send_moderation_notification(revision, notification, excluded_user=None):
 
 
 def send_notification(recipient_users, notification, extra_context):
-    # Get list of email addresses
-    email_recipients = [
-        recipient
-        for recipient in recipient_users
-        if recipient.is_active
-        and recipient.email
-        and getattr(
-            UserProfile.get_for_user(recipient), notification + "_notifications"
+    # Fetch the profiles for all recipients in one query, rather than calling
+    # UserProfile.get_for_user once per recipient
+    recipient_users = list(recipient_users)
+    profiles = {
+        profile.user_id: profile
+        for profile in UserProfile.objects.filter(
+            user__in=[recipient.pk for recipient in recipient_users]
         )
-    ]
+    }
+
+    # Get list of email addresses
+    email_recipients = []
+    for recipient in recipient_users:
+        if not (recipient.is_active and recipient.email):
+            continue
+        profile = profiles.get(recipient.pk)
+        if profile is None:
+            # the profile doesn't exist yet - create it on demand as
+            # UserProfile.get_for_user would
+            profile = UserProfile.get_for_user(recipient)
+            profiles[recipient.pk] = profile
+        if getattr(profile, notification + "_notifications"):
+            email_recipients.append(recipient)
 
     # Return if there are no email addresses
     if not email_recipients:
         return True
 
-    # Get template
-    template_subject = "wagtailadmin/notifications/" + notification + "_subject.txt"
-    template_text = "wagtailadmin/notifications/" + notification + ".txt"
-    template_html = "wagtailadmin/notifications/" + notification + ".html"
+    # Resolve the templates once, rather than once per recipient
+    template_subject = get_template(
+        "wagtailadmin/notifications/" + notification + "_subject.txt"
+    )
+    template_text = get_template("wagtailadmin/notifications/" + notification + ".txt")
+    if getattr(settings, "WAGTAILADMIN_NOTIFICATION_USE_HTML", False):
+        template_html = get_template(
+            "wagtailadmin/notifications/" + notification + ".html"
+        )
+    else:
+        template_html = None
 
-    # Common context to template
-    context = {
+    # Common context to template, built once and shared by every recipient
+    base_context = {
         "settings": settings,
+        **extra_context,
     }
-    context.update(extra_context)
 
     connection = get_connection()
 
@@ -124,18 +144,18 @@ def send_notification(recipient_users, notification, extra_context):
         # Send emails
         sent_count = 0
         for recipient in email_recipients:
-            # update context with this recipient
-            context["user"] = recipient
+            # bind this recipient on top of the shared context
+            context = {**base_context, "user": recipient}
 
             # Translate text to the recipient language settings
-            with override(recipient.wagtail_userprofile.get_preferred_language()):
+            with override(profiles[recipient.pk].get_preferred_language()):
                 # Get email subject and content
-                email_subject = render_to_string(template_subject, context).strip()
-                email_content = render_to_string(template_text, context).strip()
+                email_subject = template_subject.render(context).strip()
+                email_content = template_text.render(context).strip()
 
             kwargs = {}
-            if getattr(settings, "WAGTAILADMIN_NOTIFICATION_USE_HTML", False):
-                kwargs["html_message"] = render_to_string(template_html, context)
+            if template_html is not None:
+                kwargs["html_message"] = template_html.render(context)
 
             try:
                 # Send email
@@ -225,17 +245,35 @@ class EmailNotificationMixin:
     def get_valid_recipients(self, instance, **kwargs):
         """Filters notification recipients to those allowing the notification type on their UserProfile, and those
         with an email address"""
-        return {
+        candidates = [
             recipient
             for recipient in self.get_recipient_users(instance, **kwargs)
-            if recipient.is_active
-            and recipient.email
-            and getattr(
-                UserProfile.get_for_user(recipient),
-                self.notification + "_notifications",
+            if recipient.is_active and recipient.email
+        ]
+
+        # Fetch the profiles for all candidates in one query, rather than calling
+        # UserProfile.get_for_user once per recipient
+        profiles = {
+            profile.user_id: profile
+            for profile in UserProfile.objects.filter(
+                user__in=[recipient.pk for recipient in candidates]
             )
         }
 
+        recipients = set()
+        for recipient in candidates:
+            profile = profiles.get(recipient.pk)
+            if profile is None:
+                # the profile doesn't exist yet - create it on demand as
+                # UserProfile.get_for_user would
+                profile = UserProfile.get_for_user(recipient)
+            # prime the reverse one-to-one cache, so that looking up the preferred
+            # language when rendering the emails doesn't re-query the profile
+            recipient.wagtail_userprofile = profile
+            if getattr(profile, self.notification + "_notifications"):
+                recipients.add(recipient)
+        return recipients
+
     def get_template_set(self, instance, **kwargs):
         """Return a dictionary of template paths for the templates for the email subject and the text and html
         alternatives"""
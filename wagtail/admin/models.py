@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import Count, Model
 from modelcluster.fields import ParentalKey
@@ -24,41 +26,64 @@ class Admin(Model):
         ]
 
 
-def get_object_usage(obj):
-    """Returns a queryset of pages that link to a particular object"""
+@lru_cache(maxsize=None)
+def _parental_keys_to_page(model):
+    """Returns the attnames of the model's ParentalKeys that point to a page"""
+    return tuple(
+        f.attname
+        for f in model._meta.fields
+        if isinstance(f, ParentalKey) and issubclass(f.remote_field.model, Page)
+    )
 
-    pages = Page.objects.none()
 
-    # get all the relation objects for obj
-    relations = [
+@lru_cache(maxsize=None)
+def _usage_relations(model):
+    """Returns the reverse relations to consider when looking up usage of a model"""
+    return [
         f
-        for f in type(obj)._meta.get_fields(include_hidden=True)
+        for f in model._meta.get_fields(include_hidden=True)
         if (f.one_to_many or f.one_to_one) and f.auto_created
     ]
-    for relation in relations:
+
+
+def get_object_usage(obj):
+    """Returns a queryset of pages that link to a particular object"""
+
+    id_querysets = []
+
+    # the relations are a static property of the model class, so are cached
+    # rather than walking _meta.get_fields on every call
+    for relation in _usage_relations(type(obj)):
         related_model = relation.related_model
 
         # if the relation is between obj and a page, get the page
         if issubclass(related_model, Page):
-            pages |= Page.objects.filter(
-                id__in=related_model._base_manager.filter(
-                    **{relation.field.name: obj.id}
-                ).values_list("id", flat=True)
+            # clear the default ordering, as compound subqueries cannot carry
+            # an ORDER BY
+            id_querysets.append(
+                related_model._base_manager.filter(**{relation.field.name: obj.id})
+                .order_by()
+                .values("id")
             )
         else:
             # if the relation is between obj and an object that has a page as a
-            # property, return the page
-            for f in related_model._meta.fields:
-                if isinstance(f, ParentalKey) and issubclass(
-                    f.remote_field.model, Page
-                ):
-                    pages |= Page.objects.filter(
-                        id__in=related_model._base_manager.filter(
-                            **{relation.field.name: obj.id}
-                        ).values_list(f.attname, flat=True)
-                    )
-
-    return pages
+            # property, return the page. Which fields are ParentalKeys to a page
+            # is a static property of the model class, so is cached
+            for attname in _parental_keys_to_page(related_model):
+                id_querysets.append(
+                    related_model._base_manager.filter(**{relation.field.name: obj.id})
+                    .order_by()
+                    .values(attname)
+                )
+
+    if not id_querysets:
+        return Page.objects.none()
+
+    # Combine the per-relation id lookups into a single UNION ALL subquery, so
+    # the whole usage check is one SQL statement and the ids are never
+    # materialised in Python
+    page_ids = id_querysets[0].union(*id_querysets[1:], all=True)
+    return Page.objects.filter(id__in=page_ids)
 
 
 def popular_tags_for_model(model, count=10):
@@ -5,6 +5,7 @@ import unittest
 
 from django import VERSION as DJANGO_VERSION
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group, Permission
 from django.core import mail
 from django.core.management import call_command
@@ -13,11 +14,18 @@ from django.urls import reverse, reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from taggit.models import Tag
 
-from wagtail.admin.auth import user_has_any_page_permission
+from wagtail.admin.auth import user_has_any_page_permission, users_with_page_permission
 from wagtail.admin.mail import send_mail
 from wagtail.admin.menu import MenuItem
+from wagtail.admin.models import get_object_usage
+from wagtail.images import get_image_model
+from wagtail.images.tests.utils import get_test_image_file
 from wagtail.models import Page
-from wagtail.test.testapp.models import RestaurantTag
+from wagtail.test.testapp.models import (
+    EventPage,
+    EventPageCarouselItem,
+    RestaurantTag,
+)
 from wagtail.test.utils import WagtailTestUtils
 
 
@@ -435,6 +443,28 @@ class TestUserPassesTestPermissionDecorator(WagtailTestUtils, TestCase):
         self.assertEqual(response.status_code, 403)
 
 
+class TestUsersWithPagePermission(WagtailTestUtils, TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        User = get_user_model()
+        self.event_page = Page.objects.get(url_path="/home/events/christmas/")
+        # "Event moderators" has publish permission on the ancestor /home/events/.
+        # The fixture's inactive user is also in that group, and must never be returned
+        self.moderator = User.objects.get(username="eventmoderator")
+        self.superuser = User.objects.get(username="superuser")
+
+    def test_permission_inherited_from_ancestor(self):
+        users = users_with_page_permission(
+            self.event_page, "publish", include_superusers=False
+        )
+        self.assertEqual(list(users), [self.moderator])
+
+    def test_include_superusers(self):
+        users = users_with_page_permission(self.event_page, "publish")
+        self.assertEqual(set(users), {self.moderator, self.superuser})
+
+
 class TestUserHasAnyPagePermission(WagtailTestUtils, TestCase):
     def test_superuser(self):
         user = self.create_superuser(
@@ -473,6 +503,42 @@ class TestUserHasAnyPagePermission(WagtailTestUtils, TestCase):
         self.assertFalse(user_has_any_page_permission(user))
 
 
+class TestGetObjectUsage(WagtailTestUtils, TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        self.image = get_image_model().objects.create(
+            title="Test image",
+            file=get_test_image_file(),
+        )
+        self.home_page = Page.objects.get(url_path="/home/")
+
+    def test_no_usage(self):
+        self.assertEqual(get_object_usage(self.image).count(), 0)
+
+    def test_image_used_by_page(self):
+        event_page = EventPage(
+            title="Event page",
+            slug="event-page",
+            location="the moon",
+            audience="public",
+            cost="free",
+            date_from="2001-01-01",
+            feed_image=self.image,
+        )
+        event_page.carousel_items = [
+            EventPageCarouselItem(caption="1234567", image=self.image, sort_order=1)
+        ]
+        self.home_page.add_child(instance=event_page)
+
+        # the image is referenced both directly (feed_image) and through a child
+        # object's ParentalKey (carousel item), so both sides of the UNION run
+        self.assertEqual(
+            list(get_object_usage(self.image).values_list("id", flat=True)),
+            [event_page.id],
+        )
+
+
 class Test404(WagtailTestUtils, TestCase):
     def test_admin_404_template_used_append_slash_true(self):
         self.login()
@@ -1,23 +1,56 @@
+from functools import lru_cache
+
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.utils.http import url_has_allowed_host_and_scheme
 
 
+@lru_cache(maxsize=1)
 def get_admin_base_url():
     """
     Gets the base URL for the wagtail admin site. This is set in `settings.WAGTAILADMIN_BASE_URL`.
+
+    The result is cached, as settings do not change in a running process; tests that
+    override WAGTAILADMIN_BASE_URL are handled via the setting_changed signal.
     """
     return getattr(settings, "WAGTAILADMIN_BASE_URL", None)
 
 
+@receiver(setting_changed)
+def _clear_admin_base_url_cache(sender, setting, **kwargs):
+    if setting == "WAGTAILADMIN_BASE_URL":
+        get_admin_base_url.cache_clear()
+
+
+# Bounded so that attacker-supplied URLs cannot grow the cache indefinitely
+@lru_cache(maxsize=1024)
+def _is_valid_next_url(host, next_url):
+    return url_has_allowed_host_and_scheme(url=next_url, allowed_hosts={host})
+
+
 def get_valid_next_url_from_request(request):
     next_url = request.POST.get("next") or request.GET.get("next")
-    if not next_url or not url_has_allowed_host_and_scheme(
-        url=next_url, allowed_hosts={request.get_host()}
-    ):
+    if not next_url:
+        return ""
+    # get_host() re-parses and re-validates the Host header each time it is
+    # called, so the result is memoised on the request
+    host = getattr(request, "_cached_host", None)
+    if host is None:
+        host = request._cached_host = request.get_host()
+    if not _is_valid_next_url(host, next_url):
         return ""
     return next_url
 
 
+@lru_cache(maxsize=None)
+def _latest_str_checks(model):
+    # imported locally to avoid a circular import at module load time
+    from wagtail.models import DraftStateMixin, Page
+
+    return issubclass(model, Page), issubclass(model, DraftStateMixin)
+
+
 def get_latest_str(obj):
     """
     Helper function to get the latest string representation of an object.
@@ -25,10 +58,11 @@ def get_latest_str(obj):
     instance, so this function utilises the latest revision's object_str
     attribute if available.
     """
-    from wagtail.models import DraftStateMixin, Page
-
-    if isinstance(obj, Page):
+    # This is called once per row when rendering admin listings, so the class
+    # checks are cached per concrete model
+    is_page, is_draftstate = _latest_str_checks(type(obj))
+    if is_page:
         return obj.specific_deferred.get_admin_display_title()
-    if isinstance(obj, DraftStateMixin) and obj.latest_revision:
+    if is_draftstate and obj.latest_revision:
         return obj.latest_revision.object_str
     return str(obj)
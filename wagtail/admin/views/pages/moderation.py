@@ -10,7 +10,9 @@ from wagtail.models import Revision
 
 
 def approve_moderation(request, revision_id):
-    revision = get_object_or_404(Revision.page_revisions, id=revision_id)
+    revision = get_object_or_404(
+        Revision.page_revisions.select_related("user"), id=revision_id
+    )
     if not revision.content_object.permissions_for_user(request.user).can_publish():
         raise PermissionDenied
 
@@ -52,7 +54,9 @@ def approve_moderation(request, revision_id):
 
 
 def reject_moderation(request, revision_id):
-    revision = get_object_or_404(Revision.page_revisions, id=revision_id)
+    revision = get_object_or_404(
+        Revision.page_revisions.select_related("user"), id=revision_id
+    )
     if not revision.content_object.permissions_for_user(request.user).can_publish():
         raise PermissionDenied
 
@@ -1,4 +1,5 @@
 import uuid
+from functools import lru_cache
 
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRel
 from django.contrib.contenttypes.models import ContentType
@@ -9,6 +10,16 @@ from modelcluster.fields import ParentalKey
 from modelcluster.models import ClusterableModel, get_all_child_relations
 from taggit.models import ItemBase
 
+_CONTENT_PATH_HASH_NAMESPACE = uuid.UUID("bdc70d8b-e7a2-4c2a-bf43-2a3e3fcbbe86")
+
+
+# The hash is pure over the content path string, and the same paths recur on
+# every save of a model, so memoise it (with a bound, as content paths contain
+# arbitrary child object ids)
+@lru_cache(maxsize=8192)
+def _get_content_path_hash(content_path):
+    return uuid.uuid5(_CONTENT_PATH_HASH_NAMESPACE, content_path)
+
 
 class ReferenceGroups:
     """
@@ -339,9 +350,7 @@ class ReferenceIndex(models.Model):
         Returns:
             A UUID instance containing the hash of the given content path
         """
-        return uuid.uuid5(
-            uuid.UUID("bdc70d8b-e7a2-4c2a-bf43-2a3e3fcbbe86"), content_path
-        )
+        return _get_content_path_hash(content_path)
 
     @classmethod
     def create_or_update_for_object(cls, object):
@@ -18,71 +18,87 @@ from wagtail.test.testapp.models import (
 
 
 class TestCreateOrUpdateForObject(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         image_model = get_image_model()
-        self.image_content_type = ContentType.objects.get_for_model(image_model)
 
-        self.test_feed_image = image_model.objects.create(
+        # Fetch both content types in a single query and warm the
+        # ContentTypeManager cache for the rest of the class
+        content_types = ContentType.objects.get_for_models(image_model, EventPage)
+        cls.image_content_type = content_types[image_model]
+        cls.event_page_ct = content_types[EventPage]
+
+        cls.test_feed_image = image_model.objects.create(
             title="Test feed image",
             file=get_test_image_file(),
         )
-        self.test_image_1 = image_model.objects.create(
+        cls.test_image_1 = image_model.objects.create(
             title="Test image 1",
             file=get_test_image_file(),
         )
-        self.test_image_2 = image_model.objects.create(
+        cls.test_image_2 = image_model.objects.create(
             title="Test image 2",
             file=get_test_image_file(),
         )
 
         # Add event page
-        self.event_page = EventPage(
+        cls.event_page = EventPage(
             title="Event page",
             slug="event-page",
             location="the moon",
             audience="public",
             cost="free",
             date_from="2001-01-01",
-            feed_image=self.test_feed_image,
+            feed_image=cls.test_feed_image,
         )
-        self.event_page.carousel_items = [
+        cls.event_page.carousel_items = [
             EventPageCarouselItem(
-                caption="1234567", image=self.test_image_1, sort_order=1
+                caption="1234567", image=cls.test_image_1, sort_order=1
             ),
             EventPageCarouselItem(
-                caption="7654321", image=self.test_image_2, sort_order=2
+                caption="7654321", image=cls.test_image_2, sort_order=2
             ),
             EventPageCarouselItem(
-                caption="abcdefg", image=self.test_image_1, sort_order=3
+                caption="abcdefg", image=cls.test_image_1, sort_order=3
             ),
         ]
-        self.root_page = Page.objects.get(id=2)
-        self.root_page.add_child(instance=self.event_page)
+        cls.root_page = Page.objects.get(id=2)
+        cls.root_page.add_child(instance=cls.event_page)
+
+        # Cache the base content type lookup so that individual tests don't
+        # have to hit the database for it again
+        cls.event_page_base_ct = ReferenceIndex._get_base_content_type(cls.event_page)
+
+        # Materialise the carousel items in a single query rather than issuing
+        # a separate .get(sort_order=...) query per item
+        carousel_ids = {
+            item.sort_order: item.id for item in cls.event_page.carousel_items.all()
+        }
 
-        self.expected_references = {
+        cls.expected_references = {
             (
-                self.image_content_type.id,
-                str(self.test_feed_image.pk),
+                cls.image_content_type.id,
+                str(cls.test_feed_image.pk),
                 "feed_image",
                 "feed_image",
             ),
             (
-                self.image_content_type.id,
-                str(self.test_image_1.pk),
+                cls.image_content_type.id,
+                str(cls.test_image_1.pk),
                 "carousel_items.item.image",
-                f"carousel_items.{self.event_page.carousel_items.get(sort_order=1).id}.image",
+                f"carousel_items.{carousel_ids[1]}.image",
             ),
             (
-                self.image_content_type.id,
-                str(self.test_image_2.pk),
+                cls.image_content_type.id,
+                str(cls.test_image_2.pk),
                 "carousel_items.item.image",
-                f"carousel_items.{self.event_page.carousel_items.get(sort_order=2).id}.image",
+                f"carousel_items.{carousel_ids[2]}.image",
             ),
             (
-                self.image_content_type.id,
-                str(self.test_image_1.pk),
+                cls.image_content_type.id,
+                str(cls.test_image_1.pk),
                 "carousel_items.item.image",
-                f"carousel_items.{self.event_page.carousel_items.get(sort_order=3).id}.image",
+                f"carousel_items.{carousel_ids[3]}.image",
             ),
         }
 
@@ -98,13 +114,13 @@ class TestCreateOrUpdateForObject(TestCase):
 
     def test_update(self):
         reference_to_keep = ReferenceIndex.objects.get(
-            base_content_type=ReferenceIndex._get_base_content_type(self.event_page),
-            content_type=ContentType.objects.get_for_model(self.event_page),
+            base_content_type=self.event_page_base_ct,
+            content_type=self.event_page_ct,
             content_path="feed_image",
         )
         reference_to_remove = ReferenceIndex.objects.create(
-            base_content_type=ReferenceIndex._get_base_content_type(self.event_page),
-            content_type=ContentType.objects.get_for_model(self.event_page),
+            base_content_type=self.event_page_base_ct,
+            content_type=self.event_page_ct,
             object_id=self.event_page.pk,
             to_content_type=self.image_content_type,
             to_object_id=self.test_image_1.pk,
@@ -115,13 +131,15 @@ class TestCreateOrUpdateForObject(TestCase):
 
         ReferenceIndex.create_or_update_for_object(self.event_page)
 
-        # Check that the record for the reference to be kept has been preserved/reused
-        self.assertTrue(ReferenceIndex.objects.filter(id=reference_to_keep.id).exists())
-
-        # Check that the record for the reference to be removed has been deleted
-        self.assertFalse(
-            ReferenceIndex.objects.filter(id=reference_to_remove.id).exists()
+        # Check in a single query that the record for the reference to be kept has been
+        # preserved/reused and the record for the reference to be removed has been deleted
+        surviving_ids = set(
+            ReferenceIndex.objects.filter(
+                id__in=[reference_to_keep.id, reference_to_remove.id]
+            ).values_list("id", flat=True)
         )
+        self.assertIn(reference_to_keep.id, surviving_ids)
+        self.assertNotIn(reference_to_remove.id, surviving_ids)
 
         # Check that the current stored references are correct
         self.assertSetEqual(
@@ -130,32 +148,7 @@ class TestCreateOrUpdateForObject(TestCase):
                     "to_content_type", "to_object_id", "model_path", "content_path"
                 )
             ),
-            {
-                (
-                    self.image_content_type.id,
-                    str(self.test_feed_image.pk),
-                    "feed_image",
-                    "feed_image",
-                ),
-                (
-                    self.image_content_type.id,
-                    str(self.test_image_1.pk),
-                    "carousel_items.item.image",
-                    f"carousel_items.{self.event_page.carousel_items.get(sort_order=1).id}.image",
-                ),
-                (
-                    self.image_content_type.id,
-                    str(self.test_image_2.pk),
-                    "carousel_items.item.image",
-                    f"carousel_items.{self.event_page.carousel_items.get(sort_order=2).id}.image",
-                ),
-                (
-                    self.image_content_type.id,
-                    str(self.test_image_1.pk),
-                    "carousel_items.item.image",
-                    f"carousel_items.{self.event_page.carousel_items.get(sort_order=3).id}.image",
-                ),
-            },
+            self.expected_references,
         )
 
     def test_saving_base_model_does_not_remove_references(self):
@@ -210,7 +203,7 @@ class TestCreateOrUpdateForObject(TestCase):
         self.assertEqual(refs.count(), 0)
 
     def test_model_field_index_ignore_generic_foreign_key(self):
-        content_type = ContentType.objects.get_for_model(self.event_page)
+        content_type = self.event_page_ct
         page1 = GenericSnippetNoFieldIndexPage(
             title="generic snippet page", snippet_content_type_nonindexed=content_type
         )